@@ -1,12 +1,33 @@
+import asyncio
 import httpx
-from typing import Optional
+import orjson
+from typing import Optional, List, Union
 from .models import CRMLeadPayload, Executive
 
 
+# Layout of the notes attached to every lead
+_NOTES_TMPL = (
+    "LinkedIn Profile: {linkedin_url}\n"
+    "Title: {title}\n"
+    "Hiring for: {company_job_title}\n"
+    "\n"
+    "Connection Message Sent:\n"
+    "{custom_message}"
+)
+_SUMMARY_TMPL = "\n\nProfile Summary:\n{profile_summary}"
+
+
 class CRMClient:
     """Client for interacting with the PatchOps CRM API"""
     
     BASE_URL = "https://work.patchops.io"
+    # Upper bound on in-flight requests so batches don't overload the CRM
+    MAX_CONCURRENT_REQUESTS = 8
+    # Lead fields that are identical for every lead the bot creates
+    LEAD_DEFAULTS = {
+        "source": "LinkedIn Sales Robot",
+        "nextSteps": "Follow up on LinkedIn connection acceptance",
+    }
     
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
@@ -15,18 +36,77 @@ class CRMClient:
         }
         if api_key:
             self.headers["Authorization"] = f"Bearer {api_key}"
+        
+        # One pooled client per CRMClient so leads reuse keep-alive connections;
+        # HTTP/2 lets concurrent batch requests multiplex over a single connection
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=self.headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True
+        )
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+    
+    async def aclose(self):
+        """Close the underlying HTTP connection pool"""
+        await self._client.aclose()
     
     async def create_lead(self, payload: CRMLeadPayload) -> dict:
         """Create a new lead in the CRM"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/api/leads",
-                json=payload.model_dump(exclude_none=True),
-                headers=self.headers,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        # Serialize straight to JSON in pydantic-core, skipping the dict round-trip
+        return await self._post_lead(payload.model_dump_json(exclude_none=True))
+    
+    async def _post_lead(self, body: bytes) -> dict:
+        """POST an already-serialized lead body"""
+        async with self._semaphore:
+            response = await self._client.post("/api/leads", content=body)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def create_leads_batch(self, bodies: List[bytes]) -> List[Union[dict, BaseException]]:
+        """Create several leads at once over the shared connection pool.
+        
+        The CRM only exposes single-lead creation, so the batch goes out as
+        concurrent requests. Failed leads come back as the raised exception.
+        """
+        return await asyncio.gather(
+            *(self._post_lead(body) for body in bodies),
+            return_exceptions=True
+        )
+    
+    def build_lead_body(
+        self,
+        executive: Executive,
+        stage_id: str,
+        custom_message: str,
+        priority: str = "medium",
+        include_summary: bool = True
+    ) -> bytes:
+        """Serialize the CRM lead for an executive profile.
+        
+        Merges the per-lead fields into LEAD_DEFAULTS directly instead of
+        building and dumping a CRMLeadPayload for every lead.
+        """
+        notes = _NOTES_TMPL.format_map({
+            "linkedin_url": executive.linkedin_url,
+            "title": executive.title,
+            "company_job_title": executive.company_job_title or "N/A",
+            "custom_message": custom_message,
+        })
+        if include_summary:
+            notes += _SUMMARY_TMPL.format_map({
+                "profile_summary": executive.profile_summary or "N/A",
+            })
+        
+        return orjson.dumps({
+            **self.LEAD_DEFAULTS,
+            "name": executive.name,
+            "stageId": stage_id,
+            "company": executive.company,
+            "priority": priority,
+            "notes": notes,
+        })
     
     async def create_lead_from_executive(
         self,
@@ -36,25 +116,5 @@ class CRMClient:
         priority: str = "medium"
     ) -> dict:
         """Create a CRM lead from an executive profile"""
-        notes = f"""LinkedIn Profile: {executive.linkedin_url}
-Title: {executive.title}
-Hiring for: {executive.company_job_title or 'N/A'}
-
-Connection Message Sent:
-{custom_message}
-
-Profile Summary:
-{executive.profile_summary or 'N/A'}"""
-
-        payload = CRMLeadPayload(
-            name=executive.name,
-            stageId=stage_id,
-            company=executive.company,
-            priority=priority,
-            source="LinkedIn Sales Robot",
-            nextSteps="Follow up on LinkedIn connection acceptance",
-            notes=notes
-        )
-        
-        return await self.create_lead(payload)
-
+        body = self.build_lead_body(executive, stage_id, custom_message, priority)
+        return await self._post_lead(body)
@@ -1,13 +1,15 @@
 import asyncio
+import json
 import time
 import re
 import traceback
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from threading import Event
-from typing import Callable, Optional, List
-from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext, Playwright
+from typing import AsyncIterator, Callable, Optional, Dict, List, Set, Tuple
+from urllib.parse import urlencode
+from playwright.async_api import async_playwright, Page, BrowserContext, Playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .models import (
     BotConfig, BotStatus, Executive, ConnectionRequest,
@@ -17,65 +19,415 @@ from .crm_client import CRMClient
 
 # Get absolute path for browser data
 BROWSER_DATA_DIR = Path(__file__).parent.parent / "browser_data"
+# Profiles we've already sent connections to, kept across runs
+SENT_PROFILES_PATH = BROWSER_DATA_DIR / "sent.json"
+# Executive search results per company, reused across runs until they expire
+EXEC_CACHE_PATH = BROWSER_DATA_DIR / "exec_cache.json"
 
-# Thread pool for running sync playwright
-_executor = ThreadPoolExecutor(max_workers=1)
+
+# LinkedIn "date posted" filter (f_TPR) for the smallest window covering N days
+_TPR_TABLE = (
+    (1, "r86400"),     # Past 24 hours
+    (7, "r604800"),    # Past week
+    (30, "r2592000"),  # Past month
+)
+
+
+def _tpr_for(days: int) -> Optional[str]:
+    """Return the f_TPR code for jobs posted within `days`, or None for no filter"""
+    for threshold, code in _TPR_TABLE:
+        if days <= threshold:
+            return code
+    return None
+
+
+# Images are switched off with a launch flag rather than a route: any route
+# makes Playwright bypass the HTTP cache for the requests it intercepts, and
+# a catch-all one sends every document, script and XHR through Python.
+# Stylesheets stay enabled since selectors rely on rendered visibility.
+_BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# The only requests routed (and aborted): web fonts and ad/analytics hosts.
+# Nothing the bot reads depends on them, and the narrow pattern leaves
+# every other request untouched.
+_BLOCKED_URL_RE = re.compile(
+    r"^https?://(?:[^/?#]*\.)?(?:"
+    r"doubleclick\.net|google-analytics\.com|googletagmanager\.com|"
+    r"px\.ads\.linkedin\.com|analytics\.pointdrive\.linkedin\.com|snap\.licdn\.com"
+    r")(?::\d+)?/"
+    r"|^[^?#]*\.(?:woff2?|ttf|otf)(?:[?#]|$)"
+)
+
+
+async def _abort_route(route):
+    """Route handler for requests the bot never needs"""
+    await route.abort()
+
+
+# Message template placeholders, e.g. "{name}"
+_PLACEHOLDER_RE = re.compile(r"\{(name|company|title|job_title)\}")
+# Executive titles; word boundaries keep "VP" from matching "VPN" (SVP/EVP/AVP still count)
+_EXEC_TITLE_RE = re.compile(
+    r"\b(CEO|CTO|COO|CFO|[SEA]?VP|Director|Head of|Chief)\b",
+    re.IGNORECASE
+)
+
+# LinkedIn page selectors
+_JOB_CARD_SELECTOR = ".job-card-container"
+_JOB_DESCRIPTION_SELECTOR = ".jobs-description__content"
+_PERSON_CARD_SELECTOR = ".entity-result"
+# Empty-state markup inside each results container, so searches with no results
+# don't wait out the timeout (.artdeco-empty-state alone also matches overlays)
+_JOB_NO_RESULTS_SELECTOR = ".jobs-search-no-results-banner, .jobs-search-results-list .artdeco-empty-state"
+_PERSON_NO_RESULTS_SELECTOR = ".search-results-container .artdeco-empty-state"
+# Present on the feed when logged in, or on the login form after a redirect
+_LOGIN_STATE_SELECTOR = "#global-nav, #username"
+
+# Extractors run in the page over all matched cards, returning plain rows.
+# Cards missing any field are dropped; `index` lets the caller click a job card.
+_JOBS_JS = """(cards) => cards.slice(0, 10).map((c, index) => ({
+    index,
+    title: c.querySelector('.job-card-list__title')?.innerText.trim(),
+    company: c.querySelector('.job-card-container__primary-description')?.innerText.trim(),
+    link: c.querySelector('a.job-card-container__link')?.href,
+})).filter(r => r.title && r.company && r.link)"""
+
+_PEOPLE_JS = """(cards) => cards.slice(0, 5).map(c => ({
+    name: c.querySelector(".entity-result__title-text a span[aria-hidden='true']")?.innerText.trim(),
+    title: c.querySelector('.entity-result__primary-subtitle')?.innerText.trim(),
+    link: c.querySelector('.entity-result__title-text a')?.href,
+})).filter(r => r.name && r.title && r.link)"""
+
+
+def _profile_key(linkedin_url: str) -> str:
+    """Normalize a profile URL (drop query string and trailing slash) for caching"""
+    return linkedin_url.split("?", 1)[0].rstrip("/")
+
+
+def _valid_cache_entry(entry, cutoff: float) -> bool:
+    """True for an unexpired exec_cache.json entry with well-formed people rows"""
+    if not isinstance(entry, dict):
+        return False
+    cached_at = entry.get("cached_at")
+    people = entry.get("people")
+    return (
+        isinstance(cached_at, (int, float))
+        and cached_at >= cutoff
+        and isinstance(people, list)
+        and all(
+            isinstance(row, dict)
+            and all(isinstance(row.get(field), str) for field in ("name", "title", "link"))
+            for row in people
+        )
+    )
+
+
+class _StopRequested(Exception):
+    """Raised when the bot is stopped while waiting to load a page"""
+
+
+class _RateLimiter:
+    """Async token bucket allowing `max_rate` acquisitions per `time_period` seconds.
+    
+    Owned by the BrowserSession and shared by every worker and every run, so
+    the overall LinkedIn request rate stays bounded no matter how many pages
+    are navigating or how often the bot is restarted.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        refill = (now - self._updated) * self.max_rate / self.time_period
+        self._tokens = min(self.max_rate, self._tokens + refill)
+        self._updated = now
+    
+    def set_rate(self, max_rate: float):
+        """Change the rate, keeping (not refilling) the tokens already available"""
+        self._refill()
+        self.max_rate = max_rate
+        self._tokens = min(self._tokens, float(max_rate))
+    
+    async def acquire(self, stop_event: Optional[asyncio.Event] = None) -> bool:
+        """Take a token, waiting for one if needed. Returns False if `stop_event` is set first."""
+        async with self._lock:
+            while True:
+                if stop_event and stop_event.is_set():
+                    return False
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) * self.time_period / self.max_rate
+                if stop_event:
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await asyncio.sleep(wait)
+
+
+class BrowserSession:
+    """Persistent Chromium context that stays warm across bot runs.
+    
+    Work on the context happens under a lease (the main page) or on a worker
+    page. Every RECYCLE_AFTER_PAGES worker pages, Playwright and the context
+    are restarted once no lease is held, which bounds the memory Playwright
+    accumulates per page. The LinkedIn login survives the restart because it
+    lives in the persistent profile directory.
+    """
+    
+    RECYCLE_AFTER_PAGES = 25
+    
+    def __init__(self):
+        self.playwright: Optional[Playwright] = None
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self._headless = False
+        self._cond = asyncio.Condition()
+        self._leases = 0
+        self._pages_opened = 0
+        self._recycling = False
+        self._page_limiter: Optional[_RateLimiter] = None
+    
+    @property
+    def is_open(self) -> bool:
+        return self.context is not None
+    
+    def page_limiter(self, max_per_minute: int) -> _RateLimiter:
+        """The session-wide page-load limiter, set to `max_per_minute`.
+        
+        Restarting the bot keeps the same bucket, so a new run doesn't get a
+        fresh burst of page loads on top of the previous run's.
+        """
+        if self._page_limiter is None:
+            self._page_limiter = _RateLimiter(max_per_minute, 60.0)
+        else:
+            self._page_limiter.set_rate(max_per_minute)
+        return self._page_limiter
+    
+    async def start(self, headless: bool = False):
+        """Launch the browser unless it is already running"""
+        if self.is_open:
+            return
+        self._headless = headless
+        await self._launch()
+    
+    async def _launch(self):
+        """Start Playwright and open the persistent context, cleaning up if that fails"""
+        try:
+            await self._open_context()
+        except Exception:
+            await self.close()
+            raise
+    
+    async def _open_context(self):
+        """Start Playwright and open the persistent context"""
+        BROWSER_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self.playwright = await async_playwright().start()
+        
+        # Use persistent context to maintain LinkedIn session
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=str(BROWSER_DATA_DIR.absolute()),
+            headless=self._headless,
+            viewport={"width": 1280, "height": 800},
+            args=_BROWSER_ARGS
+        )
+        
+        # Forget the context if the user closes the window or Chromium dies,
+        # so the next start() launches a fresh one instead of reusing it
+        self.context.on("close", self._on_context_closed)
+        
+        # Skip fonts and trackers - we only read text and links
+        await self.context.route(_BLOCKED_URL_RE, _abort_route)
+        
+        # Get the first page or create a new one
+        if self.context.pages:
+            self.page = self.context.pages[0]
+        else:
+            self.page = await self.context.new_page()
+        
+        # Add stealth measures (on the context so every page gets them)
+        await self.context.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined
+            });
+        """)
+        self._pages_opened = 0
+    
+    def _on_context_closed(self, context: BrowserContext):
+        """Drop a context that closed outside of close(), stopping its Playwright"""
+        if context is not self.context:
+            return
+        playwright = self.playwright
+        self.context = self.playwright = self.page = None
+        if playwright:
+            asyncio.get_running_loop().create_task(self._stop_playwright(playwright))
+    
+    async def _stop_playwright(self, playwright: Playwright):
+        try:
+            await playwright.stop()
+        except Exception as e:
+            print(f"Error stopping Playwright: {e}")
+    
+    async def close(self):
+        """Close the context and stop Playwright"""
+        context, playwright = self.context, self.playwright
+        self.context = self.playwright = self.page = None
+        try:
+            if context:
+                await context.close()
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+        if playwright:
+            await self._stop_playwright(playwright)
+    
+    def _require_open(self):
+        if not self.is_open:
+            raise RuntimeError("Browser is not running (it was closed or crashed) - start the bot again")
+    
+    @asynccontextmanager
+    async def lease(self):
+        """Keep the context from being recycled while the main page is in use"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self._recycling)
+            self._require_open()
+            self._leases += 1
+        try:
+            # The user may have closed the main tab while other pages kept the browser open
+            if self.page is None or self.page.is_closed():
+                self.page = await self.context.new_page()
+            yield self.page
+        finally:
+            async with self._cond:
+                self._leases -= 1
+                self._cond.notify_all()
+    
+    @asynccontextmanager
+    async def worker_page(self):
+        """Open a fresh page for one unit of work and close it afterwards"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self._recycling)
+            if self._pages_opened >= self.RECYCLE_AFTER_PAGES:
+                await self._recycle()
+            self._require_open()
+            self._pages_opened += 1
+            self._leases += 1
+        try:
+            page = await self.context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+        finally:
+            async with self._cond:
+                self._leases -= 1
+                self._cond.notify_all()
+    
+    async def _recycle(self):
+        """Restart the browser once all leases are released (caller holds _cond).
+        
+        If the relaunch fails the session is left closed and the error is raised,
+        so callers fail cleanly and the next start() tries again.
+        """
+        self._recycling = True
+        try:
+            await self._cond.wait_for(lambda: self._leases == 0)
+            await self.close()
+            await self._launch()
+        finally:
+            self._recycling = False
+            self._cond.notify_all()
 
 
 class LinkedInBot:
-    """LinkedIn automation bot using Playwright (sync API for Windows compatibility)"""
+    """LinkedIn automation bot using Playwright (async API)"""
+    
+    # CRM leads are posted in batches once this many are queued...
+    CRM_BATCH_SIZE = 10
+    # ...or once the oldest queued lead has waited this many seconds
+    CRM_MAX_WAIT = 2.0
+    # How long to wait for the element a page is loaded for (milliseconds)
+    SELECTOR_TIMEOUT = 10000
+    # Attempts per navigation; timeouts back off 1s, 2s, 4s... between them
+    NAV_ATTEMPTS = 3
+    # Seconds a company's cached executive search stays valid
+    EXEC_CACHE_TTL = 24 * 60 * 60
     
     def __init__(
         self,
         config: BotConfig,
         crm_client: CRMClient,
-        status_callback: Optional[Callable[[BotStatus], None]] = None
+        status_callback: Optional[Callable[[BotStatus], None]] = None,
+        browser: Optional[BrowserSession] = None
     ):
         self.config = config
         self.crm_client = crm_client
         self._status_callback = status_callback
         self.status = BotStatus()
-        self.playwright: Optional[Playwright] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
-        self._stop_event = Event()
-        self._loop = None  # Store the asyncio event loop for callbacks
+        # Shared with later runs when the caller keeps the session around
+        self.browser = browser or BrowserSession()
+        self._stop_event = asyncio.Event()
+        self._page_limiter = self.browser.page_limiter(config.max_page_loads_per_minute)
+        self._log_ts_second = 0
+        self._log_ts = ""
+        # CRM leads waiting to be posted
+        self._crm_queue: List[Tuple[Executive, str]] = []
+        self._crm_pending = asyncio.Event()
+        self._crm_full = asyncio.Event()
+        self._crm_stopping = False
+        self._crm_flusher: Optional[asyncio.Task] = None
+        # Task running run(), so close() can wait for the workers to wind down
+        self._run_task: Optional[asyncio.Task] = None
+        self._pending_crm: Set[asyncio.Task] = set()
+        # Connection results for this session, keyed by normalized profile URL
+        self._executive_cache: Dict[str, ConnectionRequest] = {}
+        # Profile URL -> sent_at (ISO) for every connection ever sent
+        self._sent_profiles: Dict[str, str] = {}
+        # Normalized company name -> {"cached_at": epoch seconds, "people": [row, ...]}
+        self._company_cache: Dict[str, dict] = {}
+        self._company_cache_dirty = False
+        # Per-run bookkeeping shared by the concurrent company workers
+        self._connection_slots = 0
+        self._claimed_profiles: Set[str] = set()
+        # Connection requests go out one at a time, delay_between_connections
+        # apart across all workers; only searching runs in parallel
+        self._send_lock = asyncio.Lock()
+        self._next_send_at = 0.0
     
     def _log(self, message: str):
         """Add a log message and notify callback"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        # Timestamps have one-second resolution, so format at most once per second
+        second = int(time.time())
+        if second != self._log_ts_second:
+            self._log_ts_second = second
+            self._log_ts = time.strftime("%H:%M:%S", time.localtime(second))
+        log_entry = f"[{self._log_ts}] {message}"
+        # Bounded deque, so the oldest messages drop off automatically
         self.status.log_messages.append(log_entry)
-        # Keep only last 100 messages
-        if len(self.status.log_messages) > 100:
-            self.status.log_messages = self.status.log_messages[-100:]
         self._notify_status()
     
     def _notify_status(self):
-        """Notify the callback of status change (thread-safe)"""
-        if self._status_callback:
-            if self._loop and self._loop.is_running():
-                # Schedule the callback on the main event loop from any thread
-                try:
-                    self._loop.call_soon_threadsafe(self._do_notify)
-                except Exception as e:
-                    print(f"Notify error: {e}")
-            else:
-                # Fallback: try to call directly (may work if in same thread)
-                try:
-                    self._status_callback(self.status)
-                except Exception:
-                    pass  # Ignore if we can't notify yet
-    
-    def _do_notify(self):
-        """Execute the notification on the event loop"""
-        if self._status_callback:
-            asyncio.ensure_future(self._async_broadcast())
-    
-    async def _async_broadcast(self):
-        """Async wrapper for status notification"""
+        """Notify the status callback.
+        
+        Everything runs on the event loop thread, so the callback is invoked
+        directly; the app coalesces the resulting broadcasts.
+        """
         if self._status_callback:
-            self._status_callback(self.status)
+            try:
+                self._status_callback(self.status)
+            except Exception as e:
+                print(f"Notify error: {e}")
     
     def _update_status(self, action: str, **kwargs):
         """Update bot status"""
@@ -85,54 +437,71 @@ class LinkedInBot:
                 setattr(self.status, key, value)
         self._notify_status()
     
-    def _start_browser(self, headless: bool = False):
-        """Start the browser with persistent context for LinkedIn login (sync)"""
-        self._log("Starting browser...")
+    async def _start_browser(self, headless: bool = False):
+        """Start the browser with persistent context for LinkedIn login"""
         self.status.is_running = True
-        self._update_status("Starting browser")
+        self._load_sent_profiles()
+        self._load_exec_cache()
         
-        # Ensure browser data directory exists
-        BROWSER_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        browser_data_path = str(BROWSER_DATA_DIR.absolute())
-        self._log(f"Browser data path: {browser_data_path}")
-        
-        self.playwright = sync_playwright().start()
+        if self.browser.is_open:
+            self._log("Reusing open browser")
+            return
         
-        # Use persistent context to maintain LinkedIn session
-        self.context = self.playwright.chromium.launch_persistent_context(
-            user_data_dir=browser_data_path,
-            headless=headless,
-            viewport={"width": 1280, "height": 800},
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-            ]
-        )
+        self._log("Starting browser...")
+        self._update_status("Starting browser")
+        self._log(f"Browser data path: {BROWSER_DATA_DIR.absolute()}")
+        await self.browser.start(headless=headless)
+        self._log("Browser started successfully")
+    
+    async def _interruptible_sleep(self, delay: float):
+        """Sleep for up to `delay` seconds, returning early if the bot is stopped"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _goto(self, page: Page, url: str, wait_for: Optional[str] = None):
+        """Navigate to a URL and wait for the element we need.
         
-        # Get the first page or create a new one
-        if self.context.pages:
-            self.page = self.context.pages[0]
-        else:
-            self.page = self.context.new_page()
+        LinkedIn keeps background requests running indefinitely, so waiting
+        for network idle mostly burns time; DOM content plus the target
+        selector is enough. A missing selector is not an error - the caller
+        simply finds nothing to extract.
         
-        # Add stealth measures
-        self.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        Every navigation goes through the shared page-load rate limiter, and
+        timeouts are retried with exponential backoff. Raises _StopRequested
+        if the bot is stopped while waiting for the limiter.
+        """
+        for attempt in range(self.NAV_ATTEMPTS):
+            if not await self._page_limiter.acquire(self._stop_event):
+                raise _StopRequested()
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+                break
+            except PlaywrightTimeoutError:
+                if attempt == self.NAV_ATTEMPTS - 1:
+                    raise
+                backoff = 2 ** attempt
+                self._log(f"[!] Page load timed out, retrying in {backoff}s")
+                await asyncio.sleep(backoff)
         
-        self._log("Browser started successfully")
+        if wait_for:
+            try:
+                # Attached is enough - we read the DOM, we don't need it painted
+                await page.wait_for_selector(wait_for, timeout=self.SELECTOR_TIMEOUT, state="attached")
+            except PlaywrightTimeoutError:
+                pass
     
-    def _check_login(self) -> bool:
-        """Check if user is logged into LinkedIn (sync)"""
+    async def _check_login(self) -> bool:
+        """Check if user is logged into LinkedIn"""
         self._update_status("Checking LinkedIn login status")
         
-        self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle")
-        time.sleep(2)
-        
-        # Check if we're on the login page or feed
-        current_url = self.page.url
+        async with self.browser.lease() as page:
+            # Waiting for the nav bar or login form lets any redirect settle
+            await self._goto(page, "https://www.linkedin.com/feed/", wait_for=_LOGIN_STATE_SELECTOR)
+            
+            # Check if we're on the login page or feed
+            current_url = page.url
         if "login" in current_url or "checkpoint" in current_url:
             self._log("[!] Not logged in to LinkedIn. Please log in manually.")
             return False
@@ -140,13 +509,14 @@ class LinkedInBot:
         self._log("[OK] LinkedIn login confirmed")
         return True
     
-    def _search_jobs(self) -> List[dict]:
-        """Search for jobs matching the criteria (sync)"""
+    async def _search_jobs(self) -> AsyncIterator[dict]:
+        """Search for jobs matching the criteria, yielding each match as it is found"""
         self._update_status("Searching for job postings")
-        jobs = []
+        jobs_found = 0
         
         search_config = self.config.search_config
-        description_keywords = [kw.lower() for kw in search_config.description_keywords]
+        # Lowercased and de-duplicated once per run rather than per card
+        description_keywords = list(dict.fromkeys(kw.lower() for kw in search_config.description_keywords))
         
         for job_title in search_config.job_titles:
             if self._stop_event.is_set():
@@ -155,156 +525,141 @@ class LinkedInBot:
             self._log(f"Searching for: {job_title}")
             
             # Build LinkedIn jobs search URL
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={job_title.replace(' ', '%20')}"
-            
-            if search_config.posted_within_days <= 1:
-                search_url += "&f_TPR=r86400"  # Past 24 hours
-            elif search_config.posted_within_days <= 7:
-                search_url += "&f_TPR=r604800"  # Past week
-            elif search_config.posted_within_days <= 30:
-                search_url += "&f_TPR=r2592000"  # Past month
+            params = {"keywords": job_title}
+            tpr = _tpr_for(search_config.posted_within_days)
+            if tpr:
+                params["f_TPR"] = tpr
+            search_url = "https://www.linkedin.com/jobs/search/?" + urlencode(params)
             
-            self.page.goto(search_url, wait_until="networkidle")
-            time.sleep(3)
+            # Hold the main page for the whole term so it isn't recycled mid-scan
+            async with self.browser.lease() as page:
+                await self._goto(page, search_url, wait_for=f"{_JOB_CARD_SELECTOR}, {_JOB_NO_RESULTS_SELECTOR}")
             
-            # Extract job listings
-            job_cards = self.page.query_selector_all(".job-card-container")
+                # Extract the first 10 job listings in a single browser round-trip
+                rows = await page.eval_on_selector_all(_JOB_CARD_SELECTOR, _JOBS_JS)
+                if not rows:
+                    self._log(f"No job postings found for: {job_title}")
             
-            for card in job_cards[:10]:  # Limit to first 10 per search
-                if self._stop_event.is_set():
-                    break
-                    
-                try:
-                    title_elem = card.query_selector(".job-card-list__title")
-                    company_elem = card.query_selector(".job-card-container__primary-description")
-                    link_elem = card.query_selector("a.job-card-container__link")
-                    
-                    if title_elem and company_elem and link_elem:
-                        title = title_elem.inner_text()
-                        company = company_elem.inner_text()
-                        link = link_elem.get_attribute("href")
+                for row in rows:
+                    if self._stop_event.is_set():
+                        break
+                
+                    title = row["title"]
+                    company = row["company"]
+                    job = {
+                        "title": title,
+                        "company": company,
+                        "link": row["link"],
+                        "search_term": job_title
+                    }
+                
+                    # If description keywords are specified, check the job description
+                    include = True
+                    if description_keywords:
+                        # Click on the job card to load the description
+                        try:
+                            await page.locator(_JOB_CARD_SELECTOR).nth(row["index"]).click()
+                            await asyncio.sleep(2)
                         
-                        # If description keywords are specified, check the job description
-                        if description_keywords:
-                            # Click on the job card to load the description
-                            try:
-                                card.click()
-                                time.sleep(2)
-                                
-                                # Extract job description from the details pane
-                                description_elem = self.page.query_selector(".jobs-description__content")
-                                if description_elem:
-                                    description_text = description_elem.inner_text().lower()
-                                    
-                                    # Check if any keyword is in the description
-                                    keyword_found = any(kw in description_text for kw in description_keywords)
-                                    
-                                    if keyword_found:
-                                        matched_keywords = [kw for kw in description_keywords if kw in description_text]
-                                        self._log(f"[OK] '{title}' at {company} - matches: {', '.join(matched_keywords)}")
-                                        jobs.append({
-                                            "title": title.strip(),
-                                            "company": company.strip(),
-                                            "link": link,
-                                            "search_term": job_title
-                                        })
-                                    else:
-                                        self._log(f"[--] '{title}' at {company} - no keyword match, skipping")
+                            # Extract job description from the details pane
+                            description_elem = await page.query_selector(_JOB_DESCRIPTION_SELECTOR)
+                            if description_elem:
+                                description_text = (await description_elem.inner_text()).lower()
+                            
+                                # Check which keywords appear in the description (single scan)
+                                matched_keywords = [kw for kw in description_keywords if kw in description_text]
+                            
+                                if matched_keywords:
+                                    self._log(f"[OK] '{title}' at {company} - matches: {', '.join(matched_keywords)}")
                                 else:
-                                    # Couldn't load description, include the job anyway
-                                    self._log(f"[?] Couldn't load description for '{title}', including anyway")
-                                    jobs.append({
-                                        "title": title.strip(),
-                                        "company": company.strip(),
-                                        "link": link,
-                                        "search_term": job_title
-                                    })
-                            except Exception as e:
-                                self._log(f"[?] Error checking description: {str(e)}, including job anyway")
-                                jobs.append({
-                                    "title": title.strip(),
-                                    "company": company.strip(),
-                                    "link": link,
-                                    "search_term": job_title
-                                })
-                        else:
-                            # No description keywords, include all jobs
-                            jobs.append({
-                                "title": title.strip(),
-                                "company": company.strip(),
-                                "link": link,
-                                "search_term": job_title
-                            })
-                except Exception as e:
-                    self._log(f"Error extracting job: {str(e)}")
-            
-            time.sleep(2)  # Rate limiting
+                                    self._log(f"[--] '{title}' at {company} - no keyword match, skipping")
+                                    include = False
+                            else:
+                                # Couldn't load description, include the job anyway
+                                self._log(f"[?] Couldn't load description for '{title}', including anyway")
+                        except Exception as e:
+                            self._log(f"[?] Error checking description: {str(e)}, including job anyway")
+                
+                    if include:
+                        jobs_found += 1
+                        yield job
         
-        self._log(f"Found {len(jobs)} matching job postings")
-        return jobs
+        self._log(f"Found {jobs_found} matching job postings")
     
-    def _find_company_executives(self, company_name: str, job_title: str) -> List[Executive]:
-        """Find executives at a company (sync)"""
+    async def _find_company_executives(self, page: Page, company_name: str, job_title: str) -> List[Executive]:
+        """Find executives at a company, reusing a recent search if there is one"""
         self._update_status(f"Finding executives at {company_name}")
-        executives = []
         
-        # Search for people at the company with executive titles
-        executive_titles = ["CEO", "CTO", "COO", "CFO", "VP", "Director", "Head of", "Chief"]
+        cache_key = company_name.strip().lower()
+        cached = self._company_cache.get(cache_key)
+        if cached and time.time() - cached["cached_at"] < self.EXEC_CACHE_TTL:
+            self._log(f"Using cached executives for {company_name}")
+            return self._executives_from_rows(cached["people"], company_name, job_title, validate=True)
         
-        search_query = f"{company_name}"
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={search_query.replace(' ', '%20')}&origin=GLOBAL_SEARCH_HEADER"
+        search_url = "https://www.linkedin.com/search/results/people/?" + urlencode({
+            "keywords": company_name,
+            "origin": "GLOBAL_SEARCH_HEADER",
+        })
         
-        self.page.goto(search_url, wait_until="networkidle")
-        time.sleep(3)
+        await self._goto(page, search_url, wait_for=f"{_PERSON_CARD_SELECTOR}, {_PERSON_NO_RESULTS_SELECTOR}")
         
-        # Get people results
-        person_cards = self.page.query_selector_all(".entity-result")
+        # Extract the first 5 people results in a single browser round-trip
+        rows = await page.eval_on_selector_all(_PERSON_CARD_SELECTOR, _PEOPLE_JS)
+        if not rows:
+            self._log(f"No people found at {company_name}")
         
-        for card in person_cards[:5]:  # Limit to first 5
-            if self._stop_event.is_set():
-                break
-                
-            try:
-                name_elem = card.query_selector(".entity-result__title-text a span[aria-hidden='true']")
-                title_elem = card.query_selector(".entity-result__primary-subtitle")
-                link_elem = card.query_selector(".entity-result__title-text a")
-                
-                if name_elem and title_elem and link_elem:
-                    name = name_elem.inner_text()
-                    title = title_elem.inner_text()
-                    link = link_elem.get_attribute("href")
-                    
-                    # Check if this is an executive
-                    is_executive = any(
-                        exec_title.lower() in title.lower() 
-                        for exec_title in executive_titles
-                    )
-                    
-                    if is_executive:
-                        executive = Executive(
-                            name=name.strip(),
-                            title=title.strip(),
-                            company=company_name,
-                            linkedin_url=link,
-                            company_job_title=job_title
-                        )
-                        executives.append(executive)
-                        self._log(f"Found executive: {name} - {title}")
-                        
-            except Exception as e:
-                self._log(f"Error extracting person: {str(e)}")
+        # Filter on the title before building any models for the row
+        people = [row for row in rows if _EXEC_TITLE_RE.search(row["title"]) is not None]
+        for row in people:
+            self._log(f"Found executive: {row['name']} - {row['title']}")
         
-        return executives
+        # Only cache complete, non-empty results; an empty page may just have failed to load
+        if people and not self._stop_event.is_set():
+            self._company_cache[cache_key] = {"cached_at": time.time(), "people": people}
+            self._company_cache_dirty = True
+        
+        return self._executives_from_rows(people, company_name, job_title)
+    
+    def _executives_from_rows(
+        self,
+        rows: List[dict],
+        company_name: str,
+        job_title: str,
+        validate: bool = False
+    ) -> List[Executive]:
+        """Build executives from people rows.
+        
+        Rows fresh from the page extractor are already trimmed and non-empty,
+        so they skip validation via model_construct. Rows read back from
+        exec_cache.json come from disk and are validated (validate=True).
+        """
+        build = Executive if validate else Executive.model_construct
+        return [
+            build(
+                name=row["name"],
+                title=row["title"],
+                company=company_name,
+                linkedin_url=row["link"],
+                company_job_title=job_title
+            )
+            for row in rows
+        ]
     
     def _generate_custom_message(self, executive: Executive) -> str:
         """Generate a customized connection message"""
         template = self.config.message_template.template
         
-        # Replace placeholders
-        message = template.replace("{name}", executive.name.split()[0])  # First name
-        message = message.replace("{company}", executive.company)
-        message = message.replace("{title}", executive.title)
-        message = message.replace("{job_title}", executive.company_job_title or "")
+        # First name; split() also breaks on tabs and NBSP in scraped names
+        name_parts = executive.name.split(maxsplit=1)
+        
+        # Replace all placeholders in a single pass
+        values = {
+            "name": name_parts[0] if name_parts else "",
+            "company": executive.company,
+            "title": executive.title,
+            "job_title": executive.company_job_title or "",
+        }
+        message = _PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], template)
         
         # LinkedIn has a 300 character limit for connection messages
         if len(message) > 300:
@@ -312,8 +667,12 @@ class LinkedInBot:
         
         return message
     
-    def _send_connection_request(self, executive: Executive) -> ConnectionRequest:
-        """Send a connection request to an executive (sync)"""
+    async def _send_connection_request(self, page: Page, executive: Executive) -> ConnectionRequest:
+        """Send a connection request to an executive"""
+        key = _profile_key(executive.linkedin_url)
+        if key in self._executive_cache:
+            return self._executive_cache[key]
+        
         self._update_status(f"Sending connection to {executive.name}", current_executive=executive)
         
         custom_message = self._generate_custom_message(executive)
@@ -324,44 +683,48 @@ class LinkedInBot:
         
         try:
             # Navigate to the person's profile
-            self.page.goto(executive.linkedin_url, wait_until="networkidle")
-            time.sleep(2)
+            await self._goto(
+                page,
+                executive.linkedin_url,
+                wait_for="button:has-text('Connect'), button:has-text('More')"
+            )
             
             # Look for the Connect button
-            connect_button = self.page.query_selector("button:has-text('Connect')")
+            connect_button = await page.query_selector("button:has-text('Connect')")
             
             if not connect_button:
                 # Try the "More" dropdown
-                more_button = self.page.query_selector("button:has-text('More')")
+                more_button = await page.query_selector("button:has-text('More')")
                 if more_button:
-                    more_button.click()
-                    time.sleep(1)
-                    connect_button = self.page.query_selector("div[role='menuitem']:has-text('Connect')")
+                    await more_button.click()
+                    await asyncio.sleep(1)
+                    connect_button = await page.query_selector("div[role='menuitem']:has-text('Connect')")
             
             if connect_button:
-                connect_button.click()
-                time.sleep(1)
+                await connect_button.click()
+                await asyncio.sleep(1)
                 
                 # Click "Add a note" button
-                add_note_button = self.page.query_selector("button:has-text('Add a note')")
+                add_note_button = await page.query_selector("button:has-text('Add a note')")
                 if add_note_button:
-                    add_note_button.click()
-                    time.sleep(1)
+                    await add_note_button.click()
+                    await asyncio.sleep(1)
                 
                 # Fill in the message
-                message_input = self.page.query_selector("textarea[name='message']")
+                message_input = await page.query_selector("textarea[name='message']")
                 if message_input:
-                    message_input.fill(custom_message)
-                    time.sleep(1)
+                    await message_input.fill(custom_message)
+                    await asyncio.sleep(1)
                 
                 # Click Send
-                send_button = self.page.query_selector("button:has-text('Send')")
+                send_button = await page.query_selector("button:has-text('Send')")
                 if send_button:
-                    send_button.click()
-                    time.sleep(2)
+                    await send_button.click()
+                    await asyncio.sleep(2)
                     
                     request.status = ConnectionStatus.sent
                     request.sent_at = datetime.now()
+                    self._sent_profiles[key] = request.sent_at.isoformat()
                     self._log(f"[OK] Connection sent to {executive.name}")
                     self.status.connections_sent += 1
                 else:
@@ -373,148 +736,286 @@ class LinkedInBot:
                 request.error_message = "Connect button not found"
                 self.status.connections_failed += 1
                 
+        except _StopRequested:
+            raise
         except Exception as e:
             request.status = ConnectionStatus.failed
             request.error_message = str(e)
             self._log(f"[ERR] Failed to connect with {executive.name}: {str(e)}")
             self.status.connections_failed += 1
         
+        self._executive_cache[key] = request
         self._notify_status()
         return request
     
-    def _run_sync(self):
-        """Main bot execution loop (sync version that runs in a thread)"""
+    async def _process_company(self, semaphore: asyncio.Semaphore, company: str, job_title: str):
+        """Find executives at a company and connect with them on a dedicated page"""
+        async with semaphore:
+            if self._stop_event.is_set() or self._connection_slots <= 0:
+                return
+            
+            try:
+                async with self.browser.worker_page() as page:
+                    executives = await self._find_company_executives(page, company, job_title)
+                
+                    for executive in executives:
+                        if self._stop_event.is_set() or self._connection_slots <= 0:
+                            break
+                    
+                        # Skip people already tried this session or contacted in a previous run
+                        key = _profile_key(executive.linkedin_url)
+                        if key in self._claimed_profiles or key in self._sent_profiles:
+                            self._log(f"[--] Already contacted {executive.name}, skipping")
+                            continue
+                    
+                        # Claim the profile and a connection slot before awaiting,
+                        # so concurrent workers can't double-send or overshoot the limit
+                        self._claimed_profiles.add(key)
+                        self._connection_slots -= 1
+                    
+                        async with self._send_lock:
+                            await self._wait_for_send_turn()
+                            if self._stop_event.is_set():
+                                self._connection_slots += 1
+                                break
+                        
+                            # Send connection request
+                            try:
+                                request = await self._send_connection_request(page, executive)
+                            except _StopRequested:
+                                self._connection_slots += 1
+                                raise
+                            self._next_send_at = time.monotonic() + self.config.delay_between_connections
+                    
+                        if request.status == ConnectionStatus.sent:
+                            # Queue for the CRM; leads are posted in batches in the background
+                            self._queue_crm_lead(executive, request.custom_message)
+                        else:
+                            self._connection_slots += 1
+            except _StopRequested:
+                # Stopped while waiting to load a page; the run winds down
+                pass
+    
+    async def _wait_for_send_turn(self):
+        """Wait until delay_between_connections has passed since the last request (caller holds _send_lock)"""
+        delay = self._next_send_at - time.monotonic()
+        if delay > 0:
+            self._log(f"Waiting {delay:.0f} seconds before next connection...")
+            await self._interruptible_sleep(delay)
+    
+    async def _run_async(self):
+        """Main bot execution loop"""
         self._stop_event.clear()
+        company_tasks: List[asyncio.Task] = []
         
         try:
-            self._start_browser(headless=False)
+            await self._start_browser(headless=False)
             
             # Check if logged in
-            if not self._check_login():
+            if not await self._check_login():
                 self._log("Please log in to LinkedIn in the browser window, then restart the bot.")
                 return
             
-            # Search for jobs
-            jobs = self._search_jobs()
-            
-            if not jobs:
-                self._log("No jobs found matching criteria")
-                return
-            
             # Track processed companies to avoid duplicates
             processed_companies = set()
-            connections_sent = 0
+            max_connections = self.config.max_connections_per_session
+            self._connection_slots = max_connections
+            self._claimed_profiles = set(self._executive_cache)
+            self._next_send_at = 0.0
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_companies)
+            jobs_seen = 0
             
-            for job in jobs:
-                if self._stop_event.is_set():
-                    self._log("Bot stopped by user")
-                    break
-                
-                if connections_sent >= self.config.max_connections_per_session:
-                    self._log(f"Reached max connections limit ({self.config.max_connections_per_session})")
-                    break
-                
-                company = job["company"]
-                
-                if company in processed_companies:
-                    continue
-                
-                processed_companies.add(company)
-                
-                # Find executives at this company
-                executives = self._find_company_executives(company, job["title"])
-                
-                for executive in executives:
+            # Fan out one task per company as the search yields jobs. aclosing()
+            # finalizes the generator on break, releasing its browser lease
+            # right away so a pending recycle isn't held up
+            async with aclosing(self._search_jobs()) as jobs:
+                async for job in jobs:
+                    jobs_seen += 1
                     if self._stop_event.is_set():
+                        self._log("Bot stopped by user")
                         break
                     
-                    if connections_sent >= self.config.max_connections_per_session:
+                    if self._connection_slots <= 0:
                         break
                     
-                    # Send connection request
-                    request = self._send_connection_request(executive)
+                    company = job["company"]
                     
-                    if request.status == ConnectionStatus.sent:
-                        # Log to CRM (sync call via thread)
-                        self._log_to_crm_sync(executive, request.custom_message)
-                        connections_sent += 1
+                    if company in processed_companies:
+                        continue
                     
-                    # Wait between connections
-                    if not self._stop_event.is_set():
-                        delay = self.config.delay_between_connections
-                        self._log(f"Waiting {delay} seconds before next connection...")
-                        time.sleep(delay)
+                    processed_companies.add(company)
+                    company_tasks.append(asyncio.create_task(
+                        self._process_company(semaphore, company, job["title"])
+                    ))
             
+            results = await asyncio.gather(*company_tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self._log(f"[ERR] Company search failed: {str(result)}")
+            
+            if not jobs_seen:
+                self._log("No jobs found matching criteria")
+                return
+            
+            if self._connection_slots <= 0:
+                self._log(f"Reached max connections limit ({max_connections})")
+            
+            connections_sent = max_connections - self._connection_slots
             self._log(f"Bot run completed. Sent {connections_sent} connections.")
             
+        except _StopRequested:
+            self._log("Bot stopped by user")
         except Exception as e:
             error_details = traceback.format_exc()
             self._log(f"[ERR] Bot error: {str(e)}")
             self._log(f"[ERR] Details: {error_details}")
             print(f"Bot error: {error_details}")  # Also print to console
         finally:
+            for task in company_tasks:
+                task.cancel()
+            await asyncio.gather(*company_tasks, return_exceptions=True)
+            if self._sent_profiles:
+                self._save_sent_profiles()
+            if self._company_cache_dirty:
+                self._save_exec_cache()
             self.status.is_running = False
             self._update_status("Completed")
-            self._close_sync()
     
-    def _log_to_crm_sync(self, executive: Executive, message: str) -> bool:
-        """Log the connection to the CRM (sync wrapper)"""
-        self._update_status(f"Logging {executive.name} to CRM")
+    def _queue_crm_lead(self, executive: Executive, message: str):
+        """Add a sent connection to the CRM batch queue and wake the flusher"""
+        self._log(f"Queued {executive.name} for CRM")
+        self._crm_queue.append((executive, message))
+        self._crm_pending.set()
+        if len(self._crm_queue) >= self.CRM_BATCH_SIZE:
+            self._crm_full.set()
+    
+    async def _flush_crm_queue(self):
+        """Post queued leads whenever a batch fills up or has waited long enough"""
+        while True:
+            await self._crm_pending.wait()
+            if not self._crm_stopping:
+                try:
+                    await asyncio.wait_for(self._crm_full.wait(), timeout=self.CRM_MAX_WAIT)
+                except asyncio.TimeoutError:
+                    pass
+            
+            batch, self._crm_queue = self._crm_queue, []
+            self._crm_pending.clear()
+            self._crm_full.clear()
+            if batch:
+                # Post in the background so the next batch can keep filling
+                task = asyncio.create_task(self._send_crm_batch(batch))
+                self._pending_crm.add(task)
+                task.add_done_callback(self._on_crm_batch_done)
+            
+            if self._crm_stopping and not self._crm_queue:
+                return
+    
+    def _on_crm_batch_done(self, task: asyncio.Task):
+        """Forget a finished batch task, logging it if it crashed"""
+        self._pending_crm.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._log(f"[ERR] CRM batch failed: {str(task.exception())}")
+    
+    async def _send_crm_batch(self, batch: List[Tuple[Executive, str]]):
+        """Post a batch of queued leads to the CRM"""
+        self._log(f"Logging {len(batch)} lead(s) to CRM")
+        bodies = [
+            self.crm_client.build_lead_body(
+                executive,
+                stage_id=self.config.crm_stage_id,
+                custom_message=message,
+                # The bot's leads never carried a profile summary section
+                include_summary=False
+            )
+            for executive, message in batch
+        ]
+        results = await self.crm_client.create_leads_batch(bodies)
         
+        for (executive, _), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                self._log(f"[ERR] Failed to create CRM lead for {executive.name}: {str(result)}")
+            else:
+                self._log(f"[OK] Lead created in CRM: {executive.name}")
+                self.status.leads_created += 1
+        self._notify_status()
+    
+    async def _drain_crm_queue(self):
+        """Flush any remaining leads and stop the CRM flusher"""
+        if not self._crm_flusher:
+            return
+        self._crm_stopping = True
+        self._crm_pending.set()
+        self._crm_full.set()
+        await self._crm_flusher
+        await asyncio.gather(*self._pending_crm, return_exceptions=True)
+    
+    def _load_sent_profiles(self):
+        """Load previously contacted profiles from disk"""
+        try:
+            sent_profiles = json.loads(SENT_PROFILES_PATH.read_text())
+            if not isinstance(sent_profiles, dict) or not all(
+                isinstance(key, str) and isinstance(value, str)
+                for key, value in sent_profiles.items()
+            ):
+                raise ValueError("expected a JSON object of profile URL -> timestamp")
+            self._sent_profiles = sent_profiles
+        except FileNotFoundError:
+            self._sent_profiles = {}
+        except Exception as e:
+            self._log(f"[!] Could not read {SENT_PROFILES_PATH.name}: {str(e)}")
+            self._sent_profiles = {}
+    
+    def _save_sent_profiles(self):
+        """Persist contacted profiles so later runs skip them"""
         try:
-            # Use asyncio to run the async CRM call
-            import httpx
+            tmp_path = SENT_PROFILES_PATH.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._sent_profiles, indent=2))
+            tmp_path.replace(SENT_PROFILES_PATH)
+        except Exception as e:
+            print(f"Error saving sent profiles: {e}")
+    
+    def _load_exec_cache(self):
+        """Load cached executive searches from disk, dropping expired or malformed entries"""
+        self._company_cache = {}
+        self._company_cache_dirty = False
+        try:
+            cache = json.loads(EXEC_CACHE_PATH.read_text())
+            if not isinstance(cache, dict):
+                raise ValueError("expected a JSON object")
             
-            payload = {
-                "name": executive.name,
-                "stageId": self.config.crm_stage_id,
-                "company": executive.company,
-                "priority": "medium",
-                "source": "LinkedIn Sales Robot",
-                "nextSteps": "Follow up on LinkedIn connection acceptance",
-                "notes": f"""LinkedIn Profile: {executive.linkedin_url}
-Title: {executive.title}
-Hiring for: {executive.company_job_title or 'N/A'}
-
-Connection Message Sent:
-{message}"""
+            cutoff = time.time() - self.EXEC_CACHE_TTL
+            self._company_cache = {
+                key: entry for key, entry in cache.items()
+                if _valid_cache_entry(entry, cutoff)
             }
-            
-            headers = {"Content-Type": "application/json"}
-            if self.crm_client.api_key:
-                headers["Authorization"] = f"Bearer {self.crm_client.api_key}"
-            
-            with httpx.Client() as client:
-                response = client.post(
-                    f"{self.crm_client.BASE_URL}/api/leads",
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-            
-            self._log(f"[OK] Lead created in CRM: {executive.name}")
-            self.status.leads_created += 1
-            self._notify_status()
-            return True
+            self._company_cache_dirty = len(self._company_cache) != len(cache)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            self._log(f"[ERR] Failed to create CRM lead: {str(e)}")
-            return False
+            self._log(f"[!] Could not read {EXEC_CACHE_PATH.name}: {str(e)}")
+            # Overwrite the unreadable file on the next save
+            self._company_cache_dirty = True
     
-    def _close_sync(self):
-        """Close the browser (sync)"""
+    def _save_exec_cache(self):
+        """Persist cached executive searches for later runs"""
         try:
-            if self.context:
-                self.context.close()
-            if self.playwright:
-                self.playwright.stop()
+            tmp_path = EXEC_CACHE_PATH.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._company_cache))
+            tmp_path.replace(EXEC_CACHE_PATH)
+            self._company_cache_dirty = False
         except Exception as e:
-            print(f"Error closing browser: {e}")
+            print(f"Error saving executive cache: {e}")
     
     async def run(self):
-        """Main entry point - runs the sync bot in a thread pool"""
-        self._loop = asyncio.get_running_loop()
-        await self._loop.run_in_executor(_executor, self._run_sync)
+        """Main entry point"""
+        self._run_task = asyncio.current_task()
+        self._crm_stopping = False
+        self._crm_flusher = asyncio.create_task(self._flush_crm_queue())
+        try:
+            await self._run_async()
+        finally:
+            await self._drain_crm_queue()
     
     async def stop(self):
         """Stop the bot gracefully"""
@@ -525,4 +1026,12 @@ Connection Message Sent:
         """Close the browser"""
         self._stop_event.set()
         self.status.is_running = False
+        run_task = self._run_task
+        if run_task and not run_task.done() and run_task is not asyncio.current_task():
+            # Let in-flight sends finish and run() drain the CRM queue before
+            # the pages are torn down underneath the workers
+            await asyncio.gather(run_task, return_exceptions=True)
+        else:
+            await self._drain_crm_queue()
+        await self.browser.close()
         self._update_status("Browser closed")
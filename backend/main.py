@@ -1,15 +1,16 @@
 import asyncio
-import json
+import traceback
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
 from .models import BotConfig, BotStatus, SearchConfig, MessageTemplate
-from .linkedin_bot import LinkedInBot
+from .linkedin_bot import LinkedInBot, BrowserSession
 from .crm_client import CRMClient
 
 
@@ -17,25 +18,54 @@ from .crm_client import CRMClient
 class AppState:
     bot: Optional[LinkedInBot] = None
     bot_task: Optional[asyncio.Task] = None
-    websocket_clients: list[WebSocket] = []
+    websocket_clients: set[WebSocket] = set()
     current_config: Optional[BotConfig] = None
     crm_api_key: Optional[str] = None
-    main_loop: Optional[asyncio.AbstractEventLoop] = None
+    # Shared across bot runs so leads reuse the pooled CRM connections
+    crm_client: Optional[CRMClient] = None
+    # Set whenever the bot status changes; drained by the status broadcaster
+    status_dirty: Optional[asyncio.Event] = None
+    broadcaster_task: Optional[asyncio.Task] = None
+    # Last status message pushed to clients, to skip identical re-sends
+    last_status_message: Optional[str] = None
+    # Kept warm between bot runs; only closed via close-browser or shutdown
+    browser: BrowserSession = BrowserSession()
+    # Held across start_bot's check-then-start so concurrent starts can't race
+    start_lock: Optional[asyncio.Lock] = None
 
 
 state = AppState()
 
+# Minimum seconds between status broadcasts (caps pushes at 20 Hz)
+BROADCAST_INTERVAL = 0.05
+PONG_MESSAGE = orjson.dumps({"type": "pong"}).decode()
+
+
+async def get_crm_client(api_key: Optional[str]) -> CRMClient:
+    """Return the shared CRM client, recreating it if the API key changed"""
+    if state.crm_client and state.crm_client.api_key != api_key:
+        await state.crm_client.aclose()
+        state.crm_client = None
+    if state.crm_client is None:
+        state.crm_client = CRMClient(api_key=api_key)
+    return state.crm_client
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     print("[*] LinkedIn Sales Robot starting...")
-    # Capture the main event loop
-    state.main_loop = asyncio.get_running_loop()
+    state.status_dirty = asyncio.Event()
+    state.start_lock = asyncio.Lock()
+    state.broadcaster_task = asyncio.create_task(status_broadcaster())
     yield
+    state.broadcaster_task.cancel()
     # Cleanup
     if state.bot:
         await state.bot.close()
+    await state.browser.close()
+    if state.crm_client:
+        await state.crm_client.aclose()
     print("[*] LinkedIn Sales Robot shutting down...")
 
 
@@ -51,30 +81,48 @@ app = FastAPI(
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
 
+def status_message(status: BotStatus) -> str:
+    """Serialize a status WebSocket message (straight to JSON in pydantic-core)"""
+    return '{"type":"status","data":' + status.model_dump_json() + '}'
+
+
 async def broadcast_status(status: BotStatus):
     """Broadcast bot status to all connected WebSocket clients"""
-    message = {
-        "type": "status",
-        "data": status.model_dump()
-    }
-    disconnected = []
-    for ws in state.websocket_clients:
-        try:
-            await ws.send_json(message)
-        except:
-            disconnected.append(ws)
+    # Serialize once and send the same text to every client
+    message = status_message(status)
+
+    if message == state.last_status_message:
+        return
+    state.last_status_message = message
+    
+    clients = tuple(state.websocket_clients)
+    results = await asyncio.gather(
+        *(ws.send_text(message) for ws in clients),
+        return_exceptions=True
+    )
     
-    for ws in disconnected:
-        state.websocket_clients.remove(ws)
+    state.websocket_clients.difference_update(
+        ws for ws, result in zip(clients, results) if isinstance(result, Exception)
+    )
+
+
+async def status_broadcaster():
+    """Push the latest bot status whenever it changes, at most every BROADCAST_INTERVAL"""
+    while True:
+        await state.status_dirty.wait()
+        state.status_dirty.clear()
+        if state.bot and state.websocket_clients:
+            try:
+                await broadcast_status(state.bot.status)
+            except Exception as e:
+                print(f"Broadcast error: {e}")
+        await asyncio.sleep(BROADCAST_INTERVAL)
 
 
 def status_callback(status: BotStatus):
-    """Callback for bot status updates (thread-safe)"""
-    if state.main_loop and state.main_loop.is_running():
-        # Schedule the async broadcast on the main event loop from any thread
-        state.main_loop.call_soon_threadsafe(
-            lambda: state.main_loop.create_task(broadcast_status(status))
-        )
+    """Callback for bot status updates; marks the status for the next broadcast"""
+    if state.status_dirty:
+        state.status_dirty.set()
 
 
 @app.get("/")
@@ -87,32 +135,23 @@ async def root():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
     await websocket.accept()
-    state.websocket_clients.append(websocket)
+    state.websocket_clients.add(websocket)
     
     try:
         # Send current status on connect
-        if state.bot:
-            await websocket.send_json({
-                "type": "status",
-                "data": state.bot.status.model_dump()
-            })
-        else:
-            await websocket.send_json({
-                "type": "status",
-                "data": BotStatus().model_dump()
-            })
+        status = state.bot.status if state.bot else BotStatus()
+        await websocket.send_text(status_message(status))
         
         while True:
             # Keep connection alive and handle incoming messages
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             
             if message.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text(PONG_MESSAGE)
                 
     except WebSocketDisconnect:
-        if websocket in state.websocket_clients:
-            state.websocket_clients.remove(websocket)
+        state.websocket_clients.discard(websocket)
 
 
 class StartBotRequest(BaseModel):
@@ -131,53 +170,64 @@ class StartBotRequest(BaseModel):
 @app.post("/api/start")
 async def start_bot(request: StartBotRequest):
     """Start the LinkedIn bot"""
-    if state.bot and state.bot.status.is_running:
-        raise HTTPException(status_code=400, detail="Bot is already running")
-    
-    # Store API key
-    state.crm_api_key = request.crm_api_key
-    
-    # Create config
-    config = BotConfig(
-        search_config=SearchConfig(
-            job_titles=request.job_titles,
-            description_keywords=request.description_keywords,
-            locations=request.locations,
-            posted_within_days=request.posted_within_days
-        ),
-        message_template=MessageTemplate(
-            template=request.message_template
-        ),
-        crm_stage_id=request.crm_stage_id,
-        delay_between_connections=request.delay_between_connections,
-        max_connections_per_session=request.max_connections_per_session
-    )
-    
-    state.current_config = config
-    
-    # Create CRM client
-    crm_client = CRMClient(api_key=request.crm_api_key)
-    
-    # Create and start bot
-    state.bot = LinkedInBot(
-        config=config,
-        crm_client=crm_client,
-        status_callback=status_callback
-    )
-    
-    async def run_bot_with_error_handling():
-        """Wrapper to handle bot exceptions"""
-        try:
-            await state.bot.run()
-        except Exception as e:
-            import traceback
-            error_msg = f"Bot crashed: {str(e)}\n{traceback.format_exc()}"
-            print(error_msg)
-            state.bot._log(f"[ERR] {str(e)}")
-    
-    # Run bot in background
-    state.bot_task = asyncio.create_task(run_bot_with_error_handling())
-    
+    async with state.start_lock:
+        # A run that has stopped may still be posting its last CRM leads; let it
+        # finish before its client can be swapped out below
+        if state.bot_task and not state.bot_task.done() and not (state.bot and state.bot.status.is_running):
+            await state.bot_task
+        
+        if state.bot and state.bot.status.is_running:
+            raise HTTPException(status_code=400, detail="Bot is already running")
+        
+        # Store API key
+        state.crm_api_key = request.crm_api_key
+        
+        # Create config
+        config = BotConfig(
+            search_config=SearchConfig(
+                job_titles=request.job_titles,
+                description_keywords=request.description_keywords,
+                locations=request.locations,
+                posted_within_days=request.posted_within_days
+            ),
+            message_template=MessageTemplate(
+                template=request.message_template
+            ),
+            crm_stage_id=request.crm_stage_id,
+            delay_between_connections=request.delay_between_connections,
+            max_connections_per_session=request.max_connections_per_session
+        )
+        
+        state.current_config = config
+        
+        # Reuse the shared CRM client (and its open connections) where possible
+        crm_client = await get_crm_client(request.crm_api_key)
+        
+        # Create and start bot
+        bot = LinkedInBot(
+            config=config,
+            crm_client=crm_client,
+            status_callback=status_callback,
+            browser=state.browser
+        )
+        # Mark it running now, not once the task gets going, so a start that
+        # takes the lock next is rejected rather than waiting on this run
+        bot.status.is_running = True
+        state.bot = bot
+        
+        async def run_bot_with_error_handling():
+            """Wrapper to handle bot exceptions"""
+            # Bound to this run's bot, not state.bot, which a later start replaces
+            try:
+                await bot.run()
+            except Exception as e:
+                error_msg = f"Bot crashed: {str(e)}\n{traceback.format_exc()}"
+                print(error_msg)
+                bot._log(f"[ERR] {str(e)}")
+        
+        # Run bot as a task on the event loop
+        state.bot_task = asyncio.create_task(run_bot_with_error_handling())
+        
     return {"status": "started", "message": "Bot started successfully"}
 
 
@@ -195,16 +245,21 @@ async def stop_bot():
 async def get_status():
     """Get current bot status"""
     if state.bot:
-        return state.bot.status.model_dump()
-    return BotStatus().model_dump()
+        return state.bot.status.model_dump(mode="json")
+    return BotStatus().model_dump(mode="json")
 
 
 @app.post("/api/close-browser")
 async def close_browser():
     """Close the browser"""
-    if state.bot:
-        await state.bot.close()
+    bot = state.bot
+    if bot:
+        await bot.close()
+        # The broadcaster skips ticks without a bot, so push the final
+        # "Browser closed" status before letting go of it
+        await broadcast_status(bot.status)
         state.bot = None
+    await state.browser.close()
     return {"status": "closed", "message": "Browser closed"}
 
 
@@ -219,6 +274,7 @@ async def test_crm(request: TestCRMRequest):
     """Test CRM connection"""
     try:
         crm_client = CRMClient(api_key=request.crm_api_key)
+        await crm_client.aclose()
         # We can't really test without creating a lead, so just validate the input
         return {
             "status": "ok",
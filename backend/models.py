@@ -1,9 +1,14 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List, Deque
+from collections import deque
 from enum import Enum
 from datetime import datetime
 
 
+# Number of log lines kept on BotStatus
+MAX_LOG_MESSAGES = 100
+
+
 class Priority(str, Enum):
     low = "low"
     medium = "medium"
@@ -35,6 +40,9 @@ class MessageTemplate(BaseModel):
 
 class Executive(BaseModel):
     """Represents a LinkedIn executive/lead"""
+    # Never mutated after scraping; frozen also makes instances hashable
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     title: str
     company: str
@@ -73,6 +81,8 @@ class BotConfig(BaseModel):
     crm_stage_id: str
     delay_between_connections: int = Field(default=30, description="Seconds between connections")
     max_connections_per_session: int = Field(default=20, description="Max connections per run")
+    max_concurrent_companies: int = Field(default=3, ge=1, description="Companies processed in parallel")
+    max_page_loads_per_minute: int = Field(default=10, gt=0, description="Max LinkedIn page loads per minute")
 
 
 class BotStatus(BaseModel):
@@ -83,5 +93,10 @@ class BotStatus(BaseModel):
     connections_failed: int = 0
     leads_created: int = 0
     current_executive: Optional[Executive] = None
-    log_messages: List[str] = Field(default_factory=list)
-
+    log_messages: Deque[str] = Field(default_factory=lambda: deque(maxlen=MAX_LOG_MESSAGES))
+    
+    @field_validator("log_messages")
+    @classmethod
+    def _bound_log_messages(cls, value: Deque[str]) -> Deque[str]:
+        """Keep the log bounded when a status is built from existing messages"""
+        return deque(value, maxlen=MAX_LOG_MESSAGES)
@@ -6,6 +6,8 @@ class LinkedInSalesRobot {
     constructor() {
         this.ws = null;
         this.isRunning = false;
+        // Last server log line rendered, so bursts between pushes aren't dropped
+        this.lastLogMessage = null;
         this.reconnectAttempts = 0;
         this.maxReconnectAttempts = 5;
         
@@ -189,18 +191,22 @@ class LinkedInSalesRobot {
     }
     
     updateLog(messages) {
-        // Get last message and add if new
-        const lastMessage = messages[messages.length - 1];
-        const existingEntries = this.logContainer.querySelectorAll('.log-entry');
-        
-        // Check if this message already exists
-        const lastEntry = existingEntries[existingEntries.length - 1];
-        if (lastEntry && lastEntry.dataset.message === lastMessage) {
+        // Several lines can be logged between two status pushes, so append
+        // every message after the last one already shown, not just the newest
+        const lastIndex = messages.lastIndexOf(this.lastLogMessage);
+        const newMessages = messages.slice(lastIndex + 1);
+        if (newMessages.length === 0) {
             return;
         }
         
+        newMessages.forEach((message) => this.appendLogMessage(message));
+        this.lastLogMessage = messages[messages.length - 1];
+        this.logContainer.scrollTop = this.logContainer.scrollHeight;
+    }
+    
+    appendLogMessage(message) {
         // Parse timestamp and message
-        const match = lastMessage.match(/\[(\d{2}:\d{2}:\d{2})\] (.+)/);
+        const match = message.match(/\[(\d{2}:\d{2}:\d{2})\] (.+)/);
         if (match) {
             const [, time, text] = match;
             let type = 'info';
@@ -210,14 +216,13 @@ class LinkedInSalesRobot {
             
             const entry = document.createElement('div');
             entry.className = `log-entry ${type}`;
-            entry.dataset.message = lastMessage;
+            entry.dataset.message = message;
             entry.innerHTML = `
                 <span class="log-time">${time}</span>
                 <span class="log-message">${text}</span>
             `;
             
             this.logContainer.appendChild(entry);
-            this.logContainer.scrollTop = this.logContainer.scrollHeight;
         }
     }
     
@@ -4,6 +4,7 @@ LinkedIn Sales Robot - Startup Script
 Run this to start the application.
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
@@ -43,13 +44,17 @@ def main():
     print("Starting server at http://localhost:8000")
     print("Press Ctrl+C to stop\n")
     
-    # Run uvicorn
+    # Run uvicorn on uvloop/httptools when they're installed (uvicorn[standard]
+    # ships them, except uvloop on Windows). The reloader's file watcher only
+    # runs in development: set SALESBOT_DEV=1
     import uvicorn
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        reload=os.environ.get("SALESBOT_DEV") == "1"
     )
 
 